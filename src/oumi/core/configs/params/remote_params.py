@@ -39,7 +39,17 @@ class RemoteParams(BaseParams):
     """Base delay in seconds for exponential backoff between retries."""
 
     retry_backoff_max: float = 30.0
-    """Maximum delay in seconds between retries."""
+    """Maximum delay in seconds between retries.
+
+    Also caps delays requested by the server via the `Retry-After` header.
+    """
+
+    retry_backoff_jitter: float = 0.0
+    """Maximum random jitter in seconds added to each retry delay.
+
+    A non-zero value spreads out retries from concurrent workers that failed at the
+    same time (e.g., on a rate limit), instead of retrying in lockstep.
+    """
 
     connection_timeout: float = 300.0
     """Timeout in seconds for a request to an API."""
@@ -101,6 +111,8 @@ class RemoteParams(BaseParams):
             raise ValueError(
                 "Retry backoff max must be greater than or equal to retry backoff base."
             )
+        if self.retry_backoff_jitter < 0:
+            raise ValueError("Retry backoff jitter must be greater than or equal to 0.")
 
 
 @dataclass
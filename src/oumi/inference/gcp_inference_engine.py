@@ -51,6 +51,9 @@ class GoogleVertexInferenceEngine(RemoteInferenceEngine):
     _region: str | None = None
     """The region for the GCP project."""
 
+    _cache_request_headers: bool = False
+    """GCP access tokens are short-lived, so the headers are built for each call."""
+
     def __init__(
         self,
         model_params: ModelParams,
@@ -13,21 +13,34 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
 import copy
+import functools
+import itertools
 import json
+import operator
 import os
-import tempfile
+import random
+import time
 import urllib.parse
 import warnings
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Mapping,
+)
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TypeVar, cast
 
-import aiofiles
 import aiohttp
-import jsonlines
+import orjson
 import pydantic
 from tqdm.asyncio import tqdm
 from typing_extensions import override
@@ -42,6 +55,7 @@ from oumi.core.configs import (
 from oumi.core.configs.params.remote_params import AdaptiveConcurrencyParams
 from oumi.core.inference import BaseInferenceEngine
 from oumi.core.types.conversation import (
+    ContentItem,
     Conversation,
     Message,
     Role,
@@ -49,18 +63,81 @@ from oumi.core.types.conversation import (
 from oumi.inference.adaptive_concurrency_controller import AdaptiveConcurrencyController
 from oumi.inference.adaptive_semaphore import PoliteAdaptiveSemaphore
 from oumi.utils.conversation_utils import (
-    convert_message_to_json_content_list,
+    convert_message_content_item_to_json_dict,
     create_list_of_message_json_dicts,
 )
 from oumi.utils.http import (
+    get_error_text_from_response,
     get_failure_reason_from_response,
+    get_retry_after_seconds,
     is_non_retriable_status_code,
 )
 
 _AUTHORIZATION_KEY: str = "Authorization"
+_CONTENT_TYPE_KEY: str = "Content-Type"
+_JSON_CONTENT_TYPE: str = "application/json"
 _BATCH_PURPOSE = "batch"
 _BATCH_ENDPOINT = "/v1/chat/completions"
 _MAX_CONNECTION_LIMIT = 200
+# Keep idle connections open across retry backoffs and batch status polls.
+_CONNECTION_KEEPALIVE_TIMEOUT = 30.0
+# Resolved API host addresses are reused for this many seconds.
+_DNS_CACHE_TTL = 300
+_MAX_CACHED_IMAGE_CONTENT_ITEMS = 32
+_MAX_CACHED_JSON_SCHEMAS = 16
+_BATCH_FILE_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+T = TypeVar("T")
+
+
+# The JSON schema used for guided decoding is the same for every request of a run,
+# so resolve it once instead of once per conversation.
+@functools.lru_cache(maxsize=_MAX_CACHED_JSON_SCHEMAS)
+def _get_pydantic_model_json_schema(model: type[pydantic.BaseModel]) -> dict[str, Any]:
+    """Returns the JSON schema of a Pydantic model."""
+    return model.model_json_schema()
+
+
+@functools.lru_cache(maxsize=_MAX_CACHED_JSON_SCHEMAS)
+def _parse_json_schema_string(json_schema: str) -> dict[str, Any]:
+    """Parses a JSON schema provided as a string."""
+    return json.loads(json_schema)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serializes an object to UTF-8 encoded JSON.
+
+    Uses `orjson`, which is considerably faster than the standard library on large
+    request bodies (e.g., with base64-encoded images). Non-string dictionary keys
+    (e.g., token IDs in `logit_bias`) are converted to strings, as in `json.dumps`.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+async def _iter_jsonl_chunks(records: Iterable[dict]) -> AsyncIterator[bytes]:
+    """Serializes records as JSON lines, yielding them in chunks of ~1 MiB.
+
+    Args:
+        records: The records to serialize, one per line.
+
+    Yields:
+        UTF-8 encoded chunks of the JSONL content.
+    """
+    chunk: list[bytes] = []
+    chunk_size = 0
+    for record in records:
+        # Append the newline separately rather than concatenating it, so each
+        # serialized record is only copied once (when the chunk is joined).
+        line = _json_dumps(record)
+        chunk.append(line)
+        chunk.append(b"\n")
+        chunk_size += len(line) + 1
+        if chunk_size >= _BATCH_FILE_UPLOAD_CHUNK_SIZE:
+            yield b"".join(chunk)
+            chunk = []
+            chunk_size = 0
+    if chunk:
+        yield b"".join(chunk)
 
 
 class BatchStatus(Enum):
@@ -74,7 +151,7 @@ class BatchStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchInfo:
     """Information about a batch job."""
 
@@ -122,6 +199,7 @@ class BatchInfo:
         Returns:
             BatchInfo: Parsed batch information
         """
+        request_counts = response.get("request_counts") or {}
         return cls(
             id=response["id"],
             status=BatchStatus(response["status"]),
@@ -140,9 +218,9 @@ class BatchInfo:
             expired_at=cls._convert_timestamp(response.get("expired_at")),
             canceling_at=cls._convert_timestamp(response.get("cancelling_at")),
             canceled_at=cls._convert_timestamp(response.get("cancelled_at")),
-            total_requests=response.get("request_counts", {}).get("total", 0),
-            completed_requests=response.get("request_counts", {}).get("completed", 0),
-            failed_requests=response.get("request_counts", {}).get("failed", 0),
+            total_requests=request_counts.get("total", 0),
+            completed_requests=request_counts.get("completed", 0),
+            failed_requests=request_counts.get("failed", 0),
             metadata=response.get("metadata"),
         )
 
@@ -181,7 +259,13 @@ class BatchListResponse:
     has_more: bool = False
 
 
-@dataclass
+# Extracts the `FileInfo` fields from a file object, in field order.
+_get_file_info_fields = operator.itemgetter(
+    "id", "filename", "bytes", "created_at", "purpose"
+)
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Information about a file."""
 
@@ -191,6 +275,11 @@ class FileInfo:
     created_at: int
     purpose: str
 
+    @classmethod
+    def from_api_response(cls, response: dict[str, Any]) -> "FileInfo":
+        """Create FileInfo from API response dictionary."""
+        return cls(*_get_file_info_fields(response))
+
 
 @dataclass
 class FileListResponse:
@@ -209,6 +298,11 @@ class RemoteInferenceEngine(BaseInferenceEngine):
     api_key_env_varname: str | None = None
     """The environment variable name for the API key."""
 
+    _cache_request_headers: bool = True
+    """Whether the request headers can be reused across requests and calls.
+
+    Engines whose credentials are short-lived access tokens must disable this."""
+
     _remote_params: RemoteParams
     """Parameters for running inference against a remote API."""
 
@@ -230,7 +324,9 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         super().__init__(model_params=model_params, generation_params=generation_params)
 
         if remote_params:
-            remote_params = copy.deepcopy(remote_params)
+            # Copy to avoid mutating the caller's params below. `RemoteParams` only
+            # holds scalar fields, so a shallow copy is sufficient.
+            remote_params = copy.copy(remote_params)
         else:
             remote_params = self._default_remote_params()
 
@@ -240,6 +336,21 @@ class RemoteInferenceEngine(BaseInferenceEngine):
             remote_params.api_key_env_varname = self.api_key_env_varname
         self._remote_params = remote_params
         self._remote_params.finalize_and_validate()
+        self._sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._request_headers_cache: (
+            tuple[tuple[str | None, ...], Mapping[str, str]] | None
+        ) = None
+        # Batches in a terminal state never change, so their status is only fetched
+        # once.
+        self._terminal_batch_infos: dict[str, BatchInfo] = {}
+        # Loading and base64-encoding images is expensive, and the same images are
+        # often shared by many conversations (e.g., few-shot examples). Content items
+        # are frozen, and so hashable, even though their type doesn't declare it.
+        self._convert_image_content_item_to_json_dict: Callable[
+            [ContentItem], dict[str, Any]
+        ] = functools.lru_cache(maxsize=_MAX_CACHED_IMAGE_CONTENT_ITEMS)(
+            convert_message_content_item_to_json_dict  # type: ignore
+        )
 
         if self._remote_params.use_adaptive_concurrency:
             max_concurrency = self._remote_params.num_workers
@@ -278,6 +389,59 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         """
         return _MAX_CONNECTION_LIMIT
 
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Creates the TCP connector (connection pool) for an HTTP session.
+
+        Idle connections are kept alive for `_CONNECTION_KEEPALIVE_TIMEOUT` seconds
+        (aiohttp's default is 15), which covers the default maximum retry backoff,
+        so retried requests and periodic status polls don't pay for a new TCP/TLS
+        handshake. `TCP_NODELAY` is enabled by aiohttp on all connections.
+        Resolved host addresses are cached for `_DNS_CACHE_TTL` seconds (aiohttp's
+        default is 10), so new connections to the API host rarely need a DNS lookup.
+
+        Returns:
+            A new `aiohttp.TCPConnector`.
+        """
+        return aiohttp.TCPConnector(
+            limit=self._get_connection_limit(),
+            keepalive_timeout=_CONNECTION_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=_DNS_CACHE_TTL,
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Returns a shared HTTP session for the running event loop.
+
+        Batch and file operations reuse one session (and its connection pool)
+        instead of opening a new connection for every request. Sessions are bound to
+        the event loop they were created in, so one session is kept per loop.
+
+        Returns:
+            The `aiohttp.ClientSession` to use for requests in the current loop.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(connector=self._create_connector())
+            self._sessions[loop] = session
+        return session
+
+    async def aclose(self) -> None:
+        """Closes the shared HTTP session of the running event loop, if any."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def _run_and_close_session(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Awaits `coro`, then closes the shared session of the running loop.
+
+        Used by synchronous entry points, whose event loop only lives for the
+        duration of a single call.
+        """
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+
     async def _try_record_success(self):
         """Try to record a success."""
         if self._remote_params.use_adaptive_concurrency:
@@ -298,6 +462,16 @@ class RemoteInferenceEngine(BaseInferenceEngine):
             messages, group_adjacent_same_role_turns=group_adjacent_same_role_turns
         )
 
+    def _convert_content_item_to_json_dict(self, item: ContentItem) -> dict[str, Any]:
+        """Returns a message content item encoded as a JSON dict.
+
+        Encoded image content items are cached, so images shared across
+        conversations are only loaded and base64-encoded once.
+        """
+        if item.is_image():
+            return self._convert_image_content_item_to_json_dict(item)
+        return convert_message_content_item_to_json_dict(item)
+
     def _convert_conversation_to_api_input(
         self,
         conversation: Conversation,
@@ -339,13 +513,11 @@ class RemoteInferenceEngine(BaseInferenceEngine):
 
         api_input = {
             "model": model_params.model_name,
-            "messages": [
-                {
-                    "content": convert_message_to_json_content_list(message),
-                    "role": message.role.value,
-                }
-                for message in conversation.messages
-            ],
+            "messages": create_list_of_message_json_dicts(
+                conversation.messages,
+                group_adjacent_same_role_turns=True,
+                convert_content_item=self._convert_content_item_to_json_dict,
+            ),
             "n": 1,  # Number of completions to generate for each prompt.
             **generation_params_dict,
         }
@@ -363,7 +535,7 @@ class RemoteInferenceEngine(BaseInferenceEngine):
                 json_schema, pydantic.BaseModel
             ):
                 schema_name = json_schema.__name__
-                schema_value = json_schema.model_json_schema()
+                schema_value = _get_pydantic_model_json_schema(json_schema)
             elif isinstance(json_schema, dict):
                 # Use a generic name if no schema is provided.
                 schema_name = "Response"
@@ -372,7 +544,7 @@ class RemoteInferenceEngine(BaseInferenceEngine):
                 # Use a generic name if no schema is provided.
                 schema_name = "Response"
                 # Try to parse as JSON string
-                schema_value = json.loads(json_schema)
+                schema_value = _parse_json_schema_string(json_schema)
             else:
                 raise ValueError(
                     f"Got unsupported JSON schema type: {type(json_schema)}"
@@ -449,6 +621,32 @@ class RemoteInferenceEngine(BaseInferenceEngine):
 
         return headers
 
+    def _get_shared_request_headers(self) -> Mapping[str, str]:
+        """Returns the (read-only) request headers for batch and file operations.
+
+        The headers only depend on the API key, so they're built once and reused
+        until the API key (or the environment variable it's read from) changes.
+        """
+        remote_params = self._remote_params
+        if not self._cache_request_headers:
+            return MappingProxyType(self._get_request_headers(remote_params))
+
+        cache_key = (
+            remote_params.api_key,
+            remote_params.api_key_env_varname,
+            os.environ.get(remote_params.api_key_env_varname)
+            if remote_params.api_key_env_varname
+            else None,
+        )
+        cache = self._request_headers_cache
+        if cache is None or cache[0] != cache_key:
+            cache = (
+                cache_key,
+                MappingProxyType(self._get_request_headers(remote_params)),
+            )
+            self._request_headers_cache = cache
+        return cache[1]
+
     def _set_required_fields_for_inference(self, remote_params: RemoteParams):
         """Set required fields for inference."""
         if not remote_params.api_url:
@@ -460,12 +658,40 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         if not remote_params.api_key:
             remote_params.api_key = self._remote_params.api_key
 
+    def _get_validated_request_headers(
+        self, remote_params: RemoteParams
+    ) -> dict[str, str]:
+        """Validates the remote params and returns the headers for API requests.
+
+        Args:
+            remote_params: Parameters for running inference against a remote API.
+
+        Returns:
+            dict[str, str]: The headers to send with every request to the API.
+        """
+        self._set_required_fields_for_inference(remote_params)
+        if not remote_params.api_url:
+            raise ValueError("API URL is required for remote inference.")
+        if not self._get_api_key(remote_params):
+            if remote_params.api_key_env_varname:
+                raise ValueError(
+                    "An API key is required for remote inference with the "
+                    f"`{self.__class__.__name__}` inference engine. "
+                    "Please set the environment variable "
+                    f"`{remote_params.api_key_env_varname}`."
+                )
+        return {
+            **self._get_request_headers(remote_params),
+            _CONTENT_TYPE_KEY: _JSON_CONTENT_TYPE,
+        }
+
     async def _query_api(
         self,
         conversation: Conversation,
         semaphore: PoliteAdaptiveSemaphore,
         session: aiohttp.ClientSession,
         inference_config: InferenceConfig | None = None,
+        request_headers: dict[str, str] | None = None,
     ) -> Conversation:
         """Queries the API with the provided input.
 
@@ -475,6 +701,9 @@ class RemoteInferenceEngine(BaseInferenceEngine):
             used if adaptive concurrency is disabled.
             session: The aiohttp session to use for the request.
             inference_config: Parameters for inference.
+            request_headers: Pre-validated request headers, shared by all the
+                requests of an inference run. If not provided, the remote params
+                are validated and the headers are built for this request.
 
         Returns:
             Conversation: Inference output.
@@ -490,28 +719,39 @@ class RemoteInferenceEngine(BaseInferenceEngine):
             model_params = inference_config.model or self._model_params
             output_path = inference_config.output_path
 
-        self._set_required_fields_for_inference(remote_params)
-        if not remote_params.api_url:
+        if request_headers is None:
+            request_headers = self._get_validated_request_headers(remote_params)
+        api_url = remote_params.api_url
+        if not api_url:
             raise ValueError("API URL is required for remote inference.")
-        if not self._get_api_key(remote_params):
-            if remote_params.api_key_env_varname:
-                raise ValueError(
-                    "An API key is required for remote inference with the "
-                    f"`{self.__class__.__name__}` inference engine. "
-                    "Please set the environment variable "
-                    f"`{remote_params.api_key_env_varname}`."
-                )
+        # Build the request body before acquiring the semaphore, so that it only
+        # bounds the HTTP requests and not the (possibly slow) image loading.
+        if any(message.contains_images() for message in conversation.messages):
+            # Loading and encoding images is blocking (disk/network I/O and
+            # base64), so run it in a thread to not stall other requests.
+            api_input = await asyncio.to_thread(
+                self._convert_conversation_to_api_input,
+                conversation,
+                generation_params,
+                model_params,
+            )
+        else:
+            api_input = self._convert_conversation_to_api_input(
+                conversation, generation_params, model_params
+            )
+        # Serialize the request body once, it's reused across retries.
+        request_body = _json_dumps(api_input)
         semaphore_or_controller = (
             self._adaptive_concurrency_controller
             if self._remote_params.use_adaptive_concurrency
             else semaphore
         )
         async with semaphore_or_controller:
-            api_input = self._convert_conversation_to_api_input(
-                conversation, generation_params, model_params
+            request_timeout = aiohttp.ClientTimeout(
+                total=remote_params.connection_timeout
             )
-            headers = self._get_request_headers(remote_params)
             failure_reason = None
+            retry_after = None
 
             # Retry the request if it fails
             for attempt in range(remote_params.max_retries + 1):
@@ -522,16 +762,27 @@ class RemoteInferenceEngine(BaseInferenceEngine):
                             remote_params.retry_backoff_base * (2 ** (attempt - 1)),
                             remote_params.retry_backoff_max,
                         )
+                        # Honor the delay requested by the server, if any.
+                        if retry_after is not None:
+                            delay = max(
+                                delay, min(retry_after, remote_params.retry_backoff_max)
+                            )
+                            retry_after = None
+                        if remote_params.retry_backoff_jitter > 0:
+                            delay += random.uniform(
+                                0, remote_params.retry_backoff_jitter
+                            )
                         await asyncio.sleep(delay)
 
                     async with session.post(
-                        remote_params.api_url,
-                        json=api_input,
-                        headers=headers,
-                        timeout=remote_params.connection_timeout,
+                        api_url,
+                        data=request_body,
+                        headers=request_headers,
+                        timeout=request_timeout,
                     ) as response:
                         if response.status != 200:
                             await self._try_record_error()
+                            retry_after = get_retry_after_seconds(response)
                             failure_reason = await get_failure_reason_from_response(
                                 response
                             )
@@ -544,46 +795,48 @@ class RemoteInferenceEngine(BaseInferenceEngine):
                                 raise RuntimeError(failure_reason)
                             continue
 
-                        # Try to parse the response as JSON
-                        try:
-                            response_json = await response.json()
-                        except (aiohttp.ContentTypeError, json.JSONDecodeError):
-                            # Try to parse as text if JSON parsing fails
-                            text_response = await response.text()
-                            try:
-                                response_json = json.loads(text_response)
-                            except (json.JSONDecodeError, ValueError) as e:
-                                await self._try_record_error()
-                                failure_reason = (
-                                    "Failed to parse response. "
-                                    f"Content type: {response.content_type}. "
-                                    f"Response text: {text_response[:200]}..."
-                                )
-                                if attempt >= remote_params.max_retries:
-                                    raise RuntimeError(
-                                        "Failed to parse response as JSON after "
-                                        f"{attempt + 1} attempts. {failure_reason}"
-                                    ) from e
-                                continue
-
-                        # Process successful response
-                        try:
-                            result = self._convert_api_output_to_conversation(
-                                response_json, conversation
-                            )
-                            # Write what we have so far to our scratch directory
-                            self._save_conversation_to_scratch(result, output_path)
-                            await self._try_record_success()
-                            return result
-                        except Exception as e:
-                            # Response was successful, but we couldn't process it.
-                            failure_reason = (
-                                f"Failed to process successful response: {str(e)}"
-                            )
-                            await self._try_record_error()
-                            if attempt >= remote_params.max_retries:
-                                raise RuntimeError(failure_reason) from e
-                            continue
+                        response_body = await response.read()
+                        content_type = response.content_type
+
+                    # The body is fully read, so the connection is already back in
+                    # the pool: parse and process the response outside of the request
+                    # context. Try to parse it as JSON, regardless of the declared
+                    # content type.
+                    try:
+                        response_json = orjson.loads(response_body)
+                    except orjson.JSONDecodeError as e:
+                        await self._try_record_error()
+                        text_response = response_body.decode("utf-8", errors="replace")
+                        failure_reason = (
+                            "Failed to parse response. "
+                            f"Content type: {content_type}. "
+                            f"Response text: {text_response[:200]}..."
+                        )
+                        if attempt >= remote_params.max_retries:
+                            raise RuntimeError(
+                                "Failed to parse response as JSON after "
+                                f"{attempt + 1} attempts. {failure_reason}"
+                            ) from e
+                        continue
+
+                    # Process successful response
+                    try:
+                        result = self._convert_api_output_to_conversation(
+                            response_json, conversation
+                        )
+                        # Write what we have so far to our scratch directory
+                        self._save_conversation_to_scratch(result, output_path)
+                        await self._try_record_success()
+                        return result
+                    except Exception as e:
+                        # Response was successful, but we couldn't process it.
+                        failure_reason = (
+                            f"Failed to process successful response: {str(e)}"
+                        )
+                        await self._try_record_error()
+                        if attempt >= remote_params.max_retries:
+                            raise RuntimeError(failure_reason) from e
+                        continue
 
                 except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                     # Connection or timeout errors are retriable.
@@ -629,27 +882,57 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         Returns:
             List[Conversation]: Inference output.
         """
+        if not input:
+            return []
+        remote_params = (
+            inference_config.remote_params if inference_config else None
+        ) or self._remote_params
+        # The headers are the same for every request, so validate the remote params
+        # and build them once per run. Engines whose headers hold short-lived access
+        # tokens leave both to each request instead.
+        request_headers = (
+            self._get_validated_request_headers(remote_params)
+            if self._cache_request_headers
+            else None
+        )
         # Limit number of HTTP connections to prevent file descriptor exhaustion.
-        connector = aiohttp.TCPConnector(limit=self._get_connection_limit())
+        connector = self._create_connector()
         # Control the number of concurrent tasks via a semaphore.
         semaphore = PoliteAdaptiveSemaphore(
             capacity=self._remote_params.num_workers,
             politeness_policy=self._remote_params.politeness_policy,
         )
+        results: list[Conversation | None] = [None] * len(input)
+        # Conversations are pulled lazily by a fixed pool of workers, so only
+        # `num_workers` requests are in flight (and in memory) at any given time.
+        pending_conversations = enumerate(input)
+        num_workers = min(self._remote_params.num_workers, len(input))
+
         async with aiohttp.ClientSession(connector=connector) as session:
-            tasks = [
-                self._query_api(
-                    conversation,
-                    semaphore,
-                    session,
-                    inference_config=inference_config,
-                )
-                for conversation in input
-            ]
+            with tqdm(total=len(input), disable=len(input) < 2) as progress_bar:
+
+                async def _worker() -> None:
+                    for index, conversation in pending_conversations:
+                        results[index] = await self._query_api(
+                            conversation,
+                            semaphore,
+                            session,
+                            inference_config=inference_config,
+                            request_headers=request_headers,
+                        )
+                        progress_bar.update(1)
+
+                workers = [asyncio.create_task(_worker()) for _ in range(num_workers)]
+                try:
+                    await asyncio.gather(*workers)
+                finally:
+                    # Stop the remaining workers if any of them failed, and wait for
+                    # them to exit before the session is closed.
+                    for worker in workers:
+                        worker.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
 
-            disable_tqdm = len(tasks) < 2
-            results = await tqdm.gather(*tasks, disable=disable_tqdm)
-            return results
+        return cast(list[Conversation], results)
 
     @override
     def _infer_online(
@@ -780,7 +1063,9 @@ class RemoteInferenceEngine(BaseInferenceEngine):
             model_params = self._model_params
 
         return safe_asyncio_run(
-            self._create_batch(conversations, generation_params, model_params)
+            self._run_and_close_session(
+                self._create_batch(conversations, generation_params, model_params)
+            )
         )
 
     def get_batch_status(
@@ -795,7 +1080,39 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         Returns:
             BatchInfo: Current status of the batch job
         """
-        return safe_asyncio_run(self._get_batch_status(batch_id))
+        return safe_asyncio_run(
+            self._run_and_close_session(self._get_batch_status(batch_id))
+        )
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        timeout: float | None = None,
+    ) -> BatchInfo:
+        """Waits for a batch inference job to reach a terminal state.
+
+        All status polls share one HTTP session, so the connection is kept alive
+        between polls.
+
+        Args:
+            batch_id: The batch job ID
+            poll_interval: Seconds to wait between status checks
+            timeout: Maximum number of seconds to wait. Waits indefinitely if None.
+
+        Returns:
+            BatchInfo: Final status of the batch job
+
+        Raises:
+            TimeoutError: If the batch didn't finish within `timeout` seconds
+        """
+        return safe_asyncio_run(
+            self._run_and_close_session(
+                self._await_batch(
+                    batch_id, poll_interval=poll_interval, timeout=timeout
+                )
+            )
+        )
 
     def list_batches(
         self,
@@ -812,9 +1129,11 @@ class RemoteInferenceEngine(BaseInferenceEngine):
             BatchListResponse: List of batch jobs
         """
         return safe_asyncio_run(
-            self._list_batches(
-                after=after,
-                limit=limit,
+            self._run_and_close_session(
+                self._list_batches(
+                    after=after,
+                    limit=limit,
+                )
             )
         )
 
@@ -836,57 +1155,58 @@ class RemoteInferenceEngine(BaseInferenceEngine):
             RuntimeError: If the batch failed or has not completed
         """
         return safe_asyncio_run(
-            self._get_batch_results_with_mapping(batch_id, conversations)
+            self._run_and_close_session(
+                self._get_batch_results_with_mapping(batch_id, conversations)
+            )
         )
 
     async def _upload_batch_file(
         self,
-        batch_requests: list[dict],
+        batch_requests: Iterable[dict],
     ) -> str:
         """Uploads a JSONL file containing batch requests.
 
+        The file is streamed to the server as it is serialized, without writing it
+        to disk or buffering the whole file in memory.
+
         Args:
-            batch_requests: List of request objects to include in the batch
+            batch_requests: Request objects to include in the batch. May be a
+                generator, which is consumed as the file is uploaded.
 
         Returns:
             str: The uploaded file ID
         """
-        # Create temporary JSONL file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".jsonl", delete=False
-        ) as tmp:
-            with jsonlines.Writer(tmp) as writer:
-                for request in batch_requests:
-                    writer.write(request)
-            tmp_path = tmp.name
+        session = await self._get_session()
+        headers = self._get_shared_request_headers()
+
+        # Create form data with the streamed file
+        form = aiohttp.FormData()
+        form.add_field(
+            "file",
+            _iter_jsonl_chunks(batch_requests),
+            filename="batch_requests.jsonl",
+        )
+        form.add_field("purpose", _BATCH_PURPOSE)
 
         try:
-            # Upload the file
-            connector = aiohttp.TCPConnector(limit=self._get_connection_limit())
-            async with aiohttp.ClientSession(connector=connector) as session:
-                headers = self._get_request_headers(self._remote_params)
-
-                # Create form data with file
-                form = aiohttp.FormData()
-                async with aiofiles.open(tmp_path, "rb") as f:
-                    file_data = await f.read()
-                    form.add_field("file", file_data, filename="batch_requests.jsonl")
-                form.add_field("purpose", _BATCH_PURPOSE)
-
-                async with session.post(
-                    self.get_file_api_url(),
-                    data=form,
-                    headers=headers,
-                ) as response:
-                    if response.status != 200:
-                        raise RuntimeError(
-                            f"Failed to upload batch file: {await response.text()}"
-                        )
-                    data = await response.json()
-                    return data["id"]
-        finally:
-            # Clean up temporary file
-            Path(tmp_path).unlink()
+            async with session.post(
+                self.get_file_api_url(),
+                data=form,
+                headers=headers,
+            ) as response:
+                if response.status != 200:
+                    error_text = await get_error_text_from_response(response)
+                    raise RuntimeError(f"Failed to upload batch file: {error_text}")
+                data = await response.json()
+                return data["id"]
+        except aiohttp.ClientConnectionError as e:
+            # aiohttp wraps errors raised while the file is being streamed (e.g., a
+            # request that can't be built) in a connection error; re-raise them.
+            if e.__cause__ is not None and not isinstance(
+                e.__cause__, (OSError, aiohttp.ClientError)
+            ):
+                raise e.__cause__ from None
+            raise
 
     async def _create_batch(
         self,
@@ -904,43 +1224,44 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         Returns:
             str: The batch job ID
         """
-        # Prepare batch requests
-        batch_requests = []
-        for i, conv in enumerate(conversations):
-            api_input = self._convert_conversation_to_api_input(
-                conv, generation_params, model_params
-            )
-            batch_requests.append(
-                {
-                    "custom_id": f"request-{i}",
-                    "method": "POST",
-                    "url": _BATCH_ENDPOINT,
-                    "body": api_input,
-                }
-            )
+        # Prepare batch requests lazily, they're serialized as the file is uploaded.
+        batch_requests: Iterator[dict] = (
+            {
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": _BATCH_ENDPOINT,
+                "body": self._convert_conversation_to_api_input(
+                    conv, generation_params, model_params
+                ),
+            }
+            for i, conv in enumerate(conversations)
+        )
+        # Build the first request before the upload starts, so invalid parameters
+        # are reported here rather than in the middle of the upload.
+        first_request = next(batch_requests, None)
+        if first_request is not None:
+            batch_requests = itertools.chain([first_request], batch_requests)
 
         # Upload batch file
         file_id = await self._upload_batch_file(batch_requests)
 
         # Create batch
-        connector = aiohttp.TCPConnector(limit=self._get_connection_limit())
-        async with aiohttp.ClientSession(connector=connector) as session:
-            headers = self._get_request_headers(self._remote_params)
-            async with session.post(
-                self.get_batch_api_url(),
-                json={
-                    "input_file_id": file_id,
-                    "endpoint": _BATCH_ENDPOINT,
-                    "completion_window": (self._remote_params.batch_completion_window),
-                },
-                headers=headers,
-            ) as response:
-                if response.status != 200:
-                    raise RuntimeError(
-                        f"Failed to create batch: {await response.text()}"
-                    )
-                data = await response.json()
-                return data["id"]
+        session = await self._get_session()
+        headers = self._get_shared_request_headers()
+        async with session.post(
+            self.get_batch_api_url(),
+            json={
+                "input_file_id": file_id,
+                "endpoint": _BATCH_ENDPOINT,
+                "completion_window": (self._remote_params.batch_completion_window),
+            },
+            headers=headers,
+        ) as response:
+            if response.status != 200:
+                error_text = await get_error_text_from_response(response)
+                raise RuntimeError(f"Failed to create batch: {error_text}")
+            data = await response.json()
+            return data["id"]
 
     async def _get_batch_status(
         self,
@@ -948,25 +1269,72 @@ class RemoteInferenceEngine(BaseInferenceEngine):
     ) -> BatchInfo:
         """Gets the status of a batch job.
 
+        Terminal statuses are cached, so repeated calls for a finished batch (e.g.,
+        to download its results again) don't query the API.
+
         Args:
             batch_id: ID of the batch job
 
         Returns:
             BatchInfo: Current status of the batch job
         """
-        connector = aiohttp.TCPConnector(limit=self._get_connection_limit())
-        async with aiohttp.ClientSession(connector=connector) as session:
-            headers = self._get_request_headers(self._remote_params)
-            async with session.get(
-                f"{self.get_batch_api_url()}/{batch_id}",
-                headers=headers,
-            ) as response:
-                if response.status != 200:
-                    raise RuntimeError(
-                        f"Failed to get batch status: {await response.text()}"
+        batch_info = self._terminal_batch_infos.get(batch_id)
+        if batch_info is not None:
+            return batch_info
+
+        session = await self._get_session()
+        headers = self._get_shared_request_headers()
+        async with session.get(
+            f"{self.get_batch_api_url()}/{batch_id}",
+            headers=headers,
+        ) as response:
+            if response.status != 200:
+                error_text = await get_error_text_from_response(response)
+                raise RuntimeError(f"Failed to get batch status: {error_text}")
+            data = await response.json()
+            batch_info = BatchInfo.from_api_response(data)
+
+        if batch_info.is_terminal:
+            self._terminal_batch_infos[batch_id] = batch_info
+        return batch_info
+
+    async def _await_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        timeout: float | None = None,
+    ) -> BatchInfo:
+        """Polls the status of a batch job until it reaches a terminal state.
+
+        Args:
+            batch_id: ID of the batch job
+            poll_interval: Seconds to wait between status checks
+            timeout: Maximum number of seconds to wait. Waits indefinitely if None.
+
+        Returns:
+            BatchInfo: Final status of the batch job
+        """
+        if poll_interval <= 0:
+            raise ValueError("Poll interval must be greater than 0.")
+        if timeout is not None and timeout < 0:
+            raise ValueError("Timeout must be greater than or equal to 0.")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            batch_info = await self._get_batch_status(batch_id)
+            if batch_info.is_terminal:
+                return batch_info
+            sleep_time = poll_interval
+            if deadline is not None:
+                remaining_time = deadline - time.monotonic()
+                if remaining_time <= 0:
+                    raise TimeoutError(
+                        f"Batch {batch_id} did not finish within {timeout} seconds. "
+                        f"Status: {batch_info.status}"
                     )
-                data = await response.json()
-                return BatchInfo.from_api_response(data)
+                # Poll one last time at the deadline.
+                sleep_time = min(poll_interval, remaining_time)
+            await asyncio.sleep(sleep_time)
 
     async def _list_batches(
         self,
@@ -982,38 +1350,35 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         Returns:
             BatchListResponse: List of batch jobs
         """
-        connector = aiohttp.TCPConnector(limit=self._get_connection_limit())
-        async with aiohttp.ClientSession(connector=connector) as session:
-            headers = self._get_request_headers(self._remote_params)
-
-            params = {}
-            if after:
-                params["after"] = after
-            if limit:
-                params["limit"] = str(limit)
-
-            async with session.get(
-                self.get_batch_api_url(),
-                headers=headers,
-                params=params,
-            ) as response:
-                if response.status != 200:
-                    raise RuntimeError(
-                        f"Failed to list batches: {await response.text()}"
-                    )
-                data = await response.json()
-
-                batches = [
-                    BatchInfo.from_api_response(batch_data)
-                    for batch_data in data["data"]
-                ]
+        session = await self._get_session()
+        headers = self._get_shared_request_headers()
+
+        params = {}
+        if after:
+            params["after"] = after
+        if limit:
+            params["limit"] = str(limit)
+
+        async with session.get(
+            self.get_batch_api_url(),
+            headers=headers,
+            params=params,
+        ) as response:
+            if response.status != 200:
+                error_text = await get_error_text_from_response(response)
+                raise RuntimeError(f"Failed to list batches: {error_text}")
+            data = orjson.loads(await response.read())
+
+            batches = [
+                BatchInfo.from_api_response(batch_data) for batch_data in data["data"]
+            ]
 
-                return BatchListResponse(
-                    batches=batches,
-                    first_id=data.get("first_id"),
-                    last_id=data.get("last_id"),
-                    has_more=data.get("has_more", False),
-                )
+            return BatchListResponse(
+                batches=batches,
+                first_id=data.get("first_id"),
+                last_id=data.get("last_id"),
+                has_more=data.get("has_more", False),
+            )
 
     async def _get_batch_results_with_mapping(
         self,
@@ -1051,34 +1416,36 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         if not batch_info.output_file_id:
             raise RuntimeError("No output file available")
 
-        results_content = await self._download_file(batch_info.output_file_id)
-
-        # Parse results and map by custom_id
-        results_by_id: dict[str, dict] = {}
-        for line in results_content.splitlines():
-            result = json.loads(line)
-            custom_id = result.get("custom_id")
-            if not custom_id:
-                raise RuntimeError(f"Batch result missing custom_id: {result}")
-            results_by_id[custom_id] = result
-
-        # Map results back to conversations in original order
-        processed_conversations = []
-        for i, conv in enumerate(conversations):
-            custom_id = f"request-{i}"
-            result = results_by_id.get(custom_id)
-            if not result:
+        # Convert results to conversations as they are downloaded, so that parsing
+        # overlaps with the download and raw results are not kept in memory.
+        index_by_custom_id = {f"request-{i}": i for i in range(len(conversations))}
+        processed_conversations: list[Conversation | None] = [None] * len(conversations)
+        received_ids: list[str] = []
+        async with contextlib.aclosing(
+            self._iter_file_records(batch_info.output_file_id)
+        ) as results:
+            async for result in results:
+                custom_id = result.get("custom_id")
+                if not custom_id:
+                    raise RuntimeError(f"Batch result missing custom_id: {result}")
+                received_ids.append(custom_id)
+                index = index_by_custom_id.get(custom_id)
+                if index is None:
+                    continue
+                if result.get("error"):
+                    raise RuntimeError(f"Batch request failed: {result['error']}")
+                processed_conversations[index] = (
+                    self._convert_api_output_to_conversation(
+                        result["response"]["body"], conversations[index]
+                    )
+                )
+
+        for custom_id, index in index_by_custom_id.items():
+            if processed_conversations[index] is None:
                 raise RuntimeError(
-                    f"Missing result for {custom_id}. "
-                    f"Available IDs: {list(results_by_id.keys())}"
+                    f"Missing result for {custom_id}. Available IDs: {received_ids}"
                 )
-            if result.get("error"):
-                raise RuntimeError(f"Batch request failed: {result['error']}")
-            processed_conv = self._convert_api_output_to_conversation(
-                result["response"]["body"], conv
-            )
-            processed_conversations.append(processed_conv)
-        return processed_conversations
+        return cast(list[Conversation], processed_conversations)
 
     #
     # File operations
@@ -1092,11 +1459,13 @@ class RemoteInferenceEngine(BaseInferenceEngine):
     ) -> FileListResponse:
         """Lists files."""
         return safe_asyncio_run(
-            self._list_files(
-                purpose=purpose,
-                limit=limit,
-                order=order,
-                after=after,
+            self._run_and_close_session(
+                self._list_files(
+                    purpose=purpose,
+                    limit=limit,
+                    order=order,
+                    after=after,
+                )
             )
         )
 
@@ -1105,21 +1474,23 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         file_id: str,
     ) -> FileInfo:
         """Gets information about a file."""
-        return safe_asyncio_run(self._get_file(file_id))
+        return safe_asyncio_run(self._run_and_close_session(self._get_file(file_id)))
 
     def delete_file(
         self,
         file_id: str,
     ) -> bool:
         """Deletes a file."""
-        return safe_asyncio_run(self._delete_file(file_id))
+        return safe_asyncio_run(self._run_and_close_session(self._delete_file(file_id)))
 
     def get_file_content(
         self,
         file_id: str,
     ) -> str:
         """Gets a file's content."""
-        return safe_asyncio_run(self._download_file(file_id))
+        return safe_asyncio_run(
+            self._run_and_close_session(self._download_file(file_id))
+        )
 
     async def _list_files(
         self,
@@ -1139,41 +1510,34 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         Returns:
             FileListResponse: List of files
         """
-        connector = aiohttp.TCPConnector(limit=self._get_connection_limit())
-        async with aiohttp.ClientSession(connector=connector) as session:
-            headers = self._get_request_headers(self._remote_params)
-
-            params = {"order": order}
-            if purpose:
-                params["purpose"] = purpose
-            if limit:
-                params["limit"] = str(limit)
-            if after:
-                params["after"] = after
-
-            async with session.get(
-                self.get_file_api_url(),
-                headers=headers,
-                params=params,
-            ) as response:
-                if response.status != 200:
-                    raise RuntimeError(f"Failed to list files: {await response.text()}")
-                data = await response.json()
-
-                files = [
-                    FileInfo(
-                        id=file["id"],
-                        filename=file["filename"],
-                        bytes=file["bytes"],
-                        created_at=file["created_at"],
-                        purpose=file["purpose"],
-                    )
-                    for file in data["data"]
-                ]
-
-                return FileListResponse(
-                    files=files, has_more=len(files) == limit if limit else False
-                )
+        session = await self._get_session()
+        headers = self._get_shared_request_headers()
+
+        params = {"order": order}
+        if purpose:
+            params["purpose"] = purpose
+        if limit:
+            params["limit"] = str(limit)
+        if after:
+            params["after"] = after
+
+        async with session.get(
+            self.get_file_api_url(),
+            headers=headers,
+            params=params,
+        ) as response:
+            if response.status != 200:
+                error_text = await get_error_text_from_response(response)
+                raise RuntimeError(f"Failed to list files: {error_text}")
+            data = orjson.loads(await response.read())
+
+            files = [FileInfo.from_api_response(file) for file in data["data"]]
+
+            has_more = data.get("has_more")
+            if has_more is None:
+                # Servers that don't report it: assume more files on a full page.
+                has_more = len(files) == limit if limit else False
+            return FileListResponse(files=files, has_more=bool(has_more))
 
     async def _get_file(
         self,
@@ -1188,23 +1552,17 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         Returns:
             FileInfo: File information
         """
-        connector = aiohttp.TCPConnector(limit=self._get_connection_limit())
-        async with aiohttp.ClientSession(connector=connector) as session:
-            headers = self._get_request_headers(self._remote_params)
-            async with session.get(
-                f"{self.get_file_api_url()}/{file_id}",
-                headers=headers,
-            ) as response:
-                if response.status != 200:
-                    raise RuntimeError(f"Failed to get file: {await response.text()}")
-                data = await response.json()
-                return FileInfo(
-                    id=data["id"],
-                    filename=data["filename"],
-                    bytes=data["bytes"],
-                    created_at=data["created_at"],
-                    purpose=data["purpose"],
-                )
+        session = await self._get_session()
+        headers = self._get_shared_request_headers()
+        async with session.get(
+            f"{self.get_file_api_url()}/{file_id}",
+            headers=headers,
+        ) as response:
+            if response.status != 200:
+                error_text = await get_error_text_from_response(response)
+                raise RuntimeError(f"Failed to get file: {error_text}")
+            data = orjson.loads(await response.read())
+            return FileInfo.from_api_response(data)
 
     async def _delete_file(
         self,
@@ -1219,19 +1577,61 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         Returns:
             bool: True if deletion was successful
         """
-        connector = aiohttp.TCPConnector(limit=self._get_connection_limit())
-        async with aiohttp.ClientSession(connector=connector) as session:
-            headers = self._get_request_headers(self._remote_params)
-            async with session.delete(
-                f"{self.get_file_api_url()}/{file_id}",
-                headers=headers,
-            ) as response:
-                if response.status != 200:
-                    raise RuntimeError(
-                        f"Failed to delete file: {await response.text()}"
-                    )
-                data = await response.json()
-                return data.get("deleted", False)
+        session = await self._get_session()
+        headers = self._get_shared_request_headers()
+        async with session.delete(
+            f"{self.get_file_api_url()}/{file_id}",
+            headers=headers,
+        ) as response:
+            if response.status != 200:
+                error_text = await get_error_text_from_response(response)
+                raise RuntimeError(f"Failed to delete file: {error_text}")
+            data = await response.json()
+            return data.get("deleted", False)
+
+    async def _iter_file_records(
+        self,
+        file_id: str,
+    ) -> AsyncGenerator[Any, None]:
+        """Streams a JSONL file, yielding one parsed record per line.
+
+        Unlike `_download_file`, the file content is never fully held in memory,
+        and records are parsed while the rest of the file is being downloaded.
+
+        Args:
+            file_id: ID of the JSONL file to download
+
+        Yields:
+            The parsed JSON record of each non-empty line
+        """
+        session = await self._get_session()
+        headers = self._get_shared_request_headers()
+        async with session.get(
+            f"{self.get_file_api_url()}/{file_id}/content",
+            headers=headers,
+        ) as response:
+            if response.status != 200:
+                error_text = await get_error_text_from_response(response)
+                raise RuntimeError(f"Failed to download file: {error_text}")
+            # Lines may be arbitrarily long, so split chunks manually rather than
+            # using `StreamReader.readline()`, which limits the line length.
+            buffer = bytearray()
+            async for chunk in response.content.iter_any():
+                # Only search the new chunk for a line break, so that a very large
+                # record received in many chunks is not rescanned for each of them.
+                end = chunk.rfind(b"\n")
+                if end >= 0:
+                    end += len(buffer)
+                buffer.extend(chunk)
+                if end < 0:
+                    continue
+                lines = buffer[:end].split(b"\n")
+                del buffer[: end + 1]
+                for line in lines:
+                    if line.strip():
+                        yield orjson.loads(line)
+            if buffer.strip():
+                yield orjson.loads(buffer)
 
     async def _download_file(
         self,
@@ -1245,15 +1645,13 @@ class RemoteInferenceEngine(BaseInferenceEngine):
         Returns:
             str: The file content
         """
-        connector = aiohttp.TCPConnector(limit=self._get_connection_limit())
-        async with aiohttp.ClientSession(connector=connector) as session:
-            headers = self._get_request_headers(self._remote_params)
-            async with session.get(
-                f"{self.get_file_api_url()}/{file_id}/content",
-                headers=headers,
-            ) as response:
-                if response.status != 200:
-                    raise RuntimeError(
-                        f"Failed to download file: {await response.text()}"
-                    )
-                return await response.text()
+        session = await self._get_session()
+        headers = self._get_shared_request_headers()
+        async with session.get(
+            f"{self.get_file_api_url()}/{file_id}/content",
+            headers=headers,
+        ) as response:
+            if response.status != 200:
+                error_text = await get_error_text_from_response(response)
+                raise RuntimeError(f"Failed to download file: {error_text}")
+            return await response.text()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import base64
+from collections.abc import Callable
 from typing import Any
 
 import PIL.Image
@@ -140,7 +141,7 @@ def convert_message_content_item_to_json_dict(
     Returns:
         Dict[str, Any]: The content for the message.
     """
-    if item.type == Type.TEXT:
+    if item.type is Type.TEXT:
         return {
             _JSON_DICT_KEY_TYPE: Type.TEXT.value,
             _JSON_DICT_KEY_TEXT: (item.content or ""),
@@ -218,6 +219,7 @@ def create_list_of_message_json_dicts(
     messages: list[Message],
     *,
     group_adjacent_same_role_turns: bool,
+    convert_content_item: Callable[[ContentItem], dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     """Returns a list of JSON dictionaries representing messages.
 
@@ -227,10 +229,15 @@ def create_list_of_message_json_dicts(
         messages: The input messages.
         group_adjacent_same_role_turns: Whether to pack adjacent messages
             from the same role into a single element in output list.
+        convert_content_item: Optional function to encode a content item as
+            a JSON dict (e.g., a caching wrapper).
+            Defaults to `convert_message_content_item_to_json_dict`.
 
     Returns:
         list[Dict[str, Any]]: The list of messages encoded as nested JSON dicts.
     """
+    if convert_content_item is None:
+        convert_content_item = convert_message_content_item_to_json_dict
     num_messages = len(messages)
     result = []
     idx = 0
@@ -246,7 +253,11 @@ def create_list_of_message_json_dicts(
             "role": messages[idx].role.value,
         }
         group_size = end_idx - idx
-        if group_size == 1 and messages[idx].contains_single_text_content_item_only():
+        if group_size == 1 and isinstance(messages[idx].content, str):
+            # Fast path for plain text messages, the most common case: use the
+            # string directly instead of wrapping it in a content item.
+            item["content"] = messages[idx].content
+        elif group_size == 1 and messages[idx].contains_single_text_content_item_only():
             # Set "content" to a primitive string value, which is the common
             # convention for text-only models.
             item["content"] = messages[idx].text_content_items[0].content
@@ -254,7 +265,10 @@ def create_list_of_message_json_dicts(
             # Set "content" to be a list of dictionaries for more complex cases.
             content_list = []
             while idx < end_idx:
-                content_list.extend(convert_message_to_json_content_list(messages[idx]))
+                content_list.extend(
+                    convert_content_item(content_item)
+                    for content_item in messages[idx].content_items
+                )
                 idx += 1
             item["content"] = content_list
 
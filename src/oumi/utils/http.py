@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import email.utils
+import time
 
 import aiohttp
 
@@ -24,11 +26,53 @@ _NON_RETRIABLE_STATUS_CODES = {
 }
 
 
+_RETRY_AFTER_STATUS_CODES = {
+    429,  # Too Many Requests
+    503,  # Service Unavailable
+}
+
+_MAX_ERROR_TEXT_BYTES = 4096
+
+
 def is_non_retriable_status_code(status_code: int) -> bool:
     """Check if a status code is non-retriable."""
     return status_code in _NON_RETRIABLE_STATUS_CODES
 
 
+def get_retry_after_seconds(response: aiohttp.ClientResponse) -> float | None:
+    """Returns the server-requested delay before retrying, if any.
+
+    Only rate-limiting and unavailability responses (429, 503) are considered.
+    Supports the `retry-after-ms` header (sent by OpenAI-compatible APIs) and the
+    standard `Retry-After` header, either as a number of seconds or an HTTP date.
+
+    Returns:
+        The delay in seconds, or None if the response doesn't specify one.
+    """
+    if response.status not in _RETRY_AFTER_STATUS_CODES:
+        return None
+
+    retry_after_ms = response.headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        except ValueError:
+            pass
+
+    retry_after = response.headers.get("Retry-After")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_date = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_date.timestamp() - time.time())
+
+
 async def get_failure_reason_from_response(
     response: aiohttp.ClientResponse,
 ) -> str:
@@ -47,3 +91,26 @@ async def get_failure_reason_from_response(
         error_msg = f"HTTP {response.status}"
 
     return error_msg
+
+
+async def get_error_text_from_response(
+    response: aiohttp.ClientResponse, max_bytes: int = _MAX_ERROR_TEXT_BYTES
+) -> str:
+    """Returns the body of an error response, truncated to `max_bytes` bytes.
+
+    Error pages (e.g., from gateways) can be large, so only the beginning of the
+    body is read.
+
+    Returns:
+        The (possibly truncated) body decoded as UTF-8.
+    """
+    body = bytearray()
+    while len(body) < max_bytes:
+        chunk = await response.content.read(max_bytes - len(body))
+        if not chunk:
+            break
+        body.extend(chunk)
+    text = body.decode("utf-8", errors="replace")
+    if not response.content.at_eof():
+        text += "..."
+    return text
@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import warnings
 from pathlib import Path
 
+# Background listeners of the loggers that use queue-based logging, by logger name.
+_queue_listeners: dict[str, logging.handlers.QueueListener] = {}
+
 
 def get_logger(
     name: str,
@@ -41,11 +48,15 @@ def get_logger(
     return logger
 
 
+@functools.cache
 def _detect_rank() -> int:
     """Detects rank.
 
     Reading the rank from the environment variables instead of
     get_device_rank_info to avoid circular imports.
+
+    The rank doesn't change during the lifetime of a process, so it's only read
+    once (use `_detect_rank.cache_clear()` to force a re-read).
     """
     for var_name in (
         "RANK",
@@ -61,6 +72,37 @@ def _detect_rank() -> int:
     return 0
 
 
+def _get_logging_level_value(level: str | int) -> int:
+    """Converts a log level name (e.g., "info") or number to a log level number.
+
+    Raises:
+        ValueError: If the log level name is unknown.
+    """
+    level_value = logging.DEBUG
+    if isinstance(level, str):
+        level_value = logging.getLevelName(level.upper())
+        if not isinstance(level_value, int):
+            raise ValueError(f"Unknown level: {level!r}")
+    elif isinstance(level, int):
+        level_value = int(level)
+    return level_value
+
+
+@functools.cache
+def _get_default_formatter(device_rank: int) -> logging.Formatter:
+    """Returns the log formatter for a rank, shared by all loggers.
+
+    Formatters are stateless, so all loggers of a process reuse one instance
+    instead of parsing the format string again for every logger.
+    """
+    return logging.Formatter(
+        "[%(asctime)s][%(name)s]"
+        f"[rank{device_rank}]"
+        "[pid:%(process)d][%(threadName)s]"
+        "[%(levelname)s]][%(filename)s:%(lineno)s] %(message)s"
+    )
+
+
 def configure_logger(
     name: str,
     level: str = "info",
@@ -71,43 +113,125 @@ def configure_logger(
 
     # Remove any existing handlers
     logger.handlers = []
+    _stop_queue_listener(name)
 
     # Configure the logger
-    logger.setLevel(level.upper())
+    level_value = _get_logging_level_value(level)
+    logger.setLevel(level_value)
 
     device_rank = _detect_rank()
 
-    default_formatter = logging.Formatter(
-        "[%(asctime)s][%(name)s]"
-        f"[rank{device_rank}]"
-        "[pid:%(process)d][%(threadName)s]"
-        "[%(levelname)s]][%(filename)s:%(lineno)s] %(message)s"
-    )
+    default_formatter = _get_default_formatter(device_rank)
+
+    handlers: list[logging.Handler] = []
 
     # Add a console handler to the logger for only global leader.
     if device_rank == 0:
         if should_use_rich_logging():
-            console_handler = _configure_rich_handler(device_rank, level)
+            console_handler = _configure_rich_handler(device_rank, level_value)
         else:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(default_formatter)
 
-        console_handler.setLevel(level.upper())
-        logger.addHandler(console_handler)
+        console_handler.setLevel(level_value)
+        handlers.append(console_handler)
 
     # Add a file handler if log_dir is provided
     if log_dir:
         log_dir = Path(log_dir)
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        file_handler = logging.FileHandler(log_dir / f"rank_{device_rank:04d}.log")
+        # Avoid a metadata write on (possibly networked) filesystems when the
+        # directory was already created, e.g., by another rank.
+        if not log_dir.is_dir():
+            log_dir.mkdir(parents=True, exist_ok=True)
+
+        # The log file is only opened when the first record is emitted.
+        file_handler = logging.FileHandler(
+            log_dir / f"rank_{device_rank:04d}.log", delay=True
+        )
         file_handler.setFormatter(default_formatter)
-        file_handler.setLevel(level.upper())
-        logger.addHandler(file_handler)
+        file_handler.setLevel(level_value)
+        handlers.append(file_handler)
+
+    if handlers and should_use_queue_logging():
+        # Emitting a record only enqueues it: formatting and writing to the
+        # console and file happen in a background thread. Records are filtered by
+        # level before they're enqueued, so a level change (see
+        # `update_logger_level`) doesn't drop the records that are still queued.
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=False
+        )
+        listener.start()
+        _queue_listeners[name] = listener
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(level_value)
+        logger.addHandler(queue_handler)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     logger.propagate = False
 
 
+def _stop_queue_listener(name: str) -> None:
+    """Stops the background listener of a logger, flushing the queued records."""
+    listener = _queue_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
+
+@atexit.register
+def _stop_all_queue_listeners() -> None:
+    """Flushes the records of all queue-based loggers at interpreter exit."""
+    for name in list(_queue_listeners):
+        _stop_queue_listener(name)
+
+
+def _use_direct_handlers_after_fork() -> None:
+    """Switches queue-based loggers to their handlers in a forked child process.
+
+    The background listener threads don't exist in a child process, so records
+    enqueued by the child would never be written. The records still queued at the
+    time of the fork are written by the parent process.
+    """
+    for name, listener in _queue_listeners.items():
+        logger = logging.getLogger(name)
+        logger.handlers = [
+            handler
+            for handler in logger.handlers
+            if not (
+                isinstance(handler, logging.handlers.QueueHandler)
+                and handler.queue is listener.queue
+            )
+        ]
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+    _queue_listeners.clear()
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows.
+    os.register_at_fork(after_in_child=_use_direct_handlers_after_fork)
+
+
+def should_use_queue_logging() -> bool:
+    """Determines whether log records are written in a background thread.
+
+    Returns:
+        bool: True if queue-based logging should be used, False otherwise.
+
+    Queue-based logging is disabled by default, and can be enabled via the
+    OUMI_ENABLE_QUEUE_LOGGING environment variable. It takes console and file I/O
+    off the logging thread, which helps processes that log at a high rate.
+    """
+    return os.environ.get("OUMI_ENABLE_QUEUE_LOGGING", "").lower() in (
+        "1",
+        "yes",
+        "on",
+        "true",
+        "y",
+    )
+
+
 def should_use_rich_logging() -> bool:
     """Determines whether rich logging should be used.
 
@@ -132,7 +256,7 @@ def should_use_rich_logging() -> bool:
 
 def _configure_rich_handler(
     device_rank: int,
-    level: str,
+    level_value: int,
 ) -> logging.Handler:
     """Configures a rich logging handler."""
     try:
@@ -144,7 +268,7 @@ def _configure_rich_handler(
             "Rich logging is not installed. Please install it with `pip install rich`."
         )
 
-    use_detailed_logging = level.upper() == "DEBUG"
+    use_detailed_logging = level_value == logging.DEBUG
 
     if use_detailed_logging:
         # Add extra logging for debugging
@@ -182,10 +306,18 @@ def update_logger_level(name: str, level: str = "info") -> None:
         level (str, optional): The log level to set for the logger. Defaults to "info".
     """
     logger = get_logger(name, level=level)
-    logger.setLevel(level.upper())
+    level_value = _get_logging_level_value(level)
+    logger.setLevel(level_value)
 
     for handler in logger.handlers:
-        handler.setLevel(level.upper())
+        handler.setLevel(level_value)
+
+    # The listener doesn't filter records by level, but the handlers are kept in
+    # sync in case they're used directly (e.g., in a forked child process).
+    listener = _queue_listeners.get(name)
+    if listener is not None:
+        for handler in listener.handlers:
+            handler.setLevel(level_value)
 
 
 def configure_dependency_warnings(level: str | int = "info") -> None:
@@ -194,17 +326,7 @@ def configure_dependency_warnings(level: str | int = "info") -> None:
     Args:
         level (str, optional): The log level to set for the logger. Defaults to "info".
     """
-    level_value = logging.DEBUG
-    if isinstance(level, str):
-        level_value = logging.getLevelName(level.upper())
-        if not isinstance(level_value, int):
-            raise TypeError(
-                f"getLevelName() mapped log level name to non-integer: "
-                f"{type(level_value)}!"
-            )
-    elif isinstance(level, int):
-        level_value = int(level)
-
+    level_value = _get_logging_level_value(level)
     if level_value > logging.DEBUG:
         warnings.filterwarnings(action="ignore", category=UserWarning, module="torch")
         warnings.filterwarnings(
@@ -30,6 +30,15 @@ def test_remote_params_validates_backoff_max():
         params.finalize_and_validate()
 
 
+def test_remote_params_validates_backoff_jitter():
+    """Test that retry_backoff_jitter is non-negative."""
+    with pytest.raises(
+        ValueError, match="Retry backoff jitter must be greater than or equal to 0"
+    ):
+        params = RemoteParams(retry_backoff_jitter=-0.1)
+        params.finalize_and_validate()
+
+
 def test_remote_params_accepts_valid_backoff():
     """Test that valid backoff parameters are accepted."""
     params = RemoteParams(retry_backoff_base=1, retry_backoff_max=30)
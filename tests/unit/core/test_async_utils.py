@@ -1,6 +1,6 @@
 import asyncio
 import re
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -69,3 +69,17 @@ def test_safe_asyncio_run_nested_fails():
         match=re.escape("asyncio.run() cannot be called from a running event loop"),
     ):
         _ = safe_asyncio_run(main())
+
+
+def test_safe_asyncio_run_uses_uvloop_if_installed():
+    async def main():
+        return 1
+
+    mock_uvloop = Mock()
+    mock_uvloop.run.side_effect = asyncio.run
+    with patch("oumi.core.async_utils.uvloop", mock_uvloop):
+        assert safe_asyncio_run(main()) == 1
+    mock_uvloop.run.assert_called_once()
+
+    with patch("oumi.core.async_utils.uvloop", None):
+        assert safe_asyncio_run(main()) == 1
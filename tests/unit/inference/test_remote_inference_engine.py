@@ -12,6 +12,8 @@ import aiohttp
 import jsonlines
 import PIL.Image
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from aioresponses import CallbackResult, aioresponses
 from pydantic import BaseModel
 
@@ -30,12 +32,18 @@ from oumi.core.types.conversation import (
     Type,
 )
 from oumi.inference import RemoteInferenceEngine
-from oumi.inference.remote_inference_engine import BatchStatus
+from oumi.inference.remote_inference_engine import (
+    BatchInfo,
+    BatchStatus,
+    FileInfo,
+    _iter_jsonl_chunks,
+)
 from oumi.utils.conversation_utils import (
     base64encode_content_item_image_bytes,
 )
 from oumi.utils.image_utils import (
     create_png_bytes_from_image,
+    load_image_png_bytes_from_path,
 )
 from tests import get_testdata_dir
 
@@ -79,6 +87,19 @@ def _get_default_model_params() -> ModelParams:
     )
 
 
+def _get_first_message_text(message: dict[str, Any]) -> str | None:
+    """Returns the first text of a message sent to the API.
+
+    Single text turns are sent as a plain string, while grouped turns (e.g.,
+    adjacent user messages) are sent as a list of content items.
+    """
+    content = message.get("content")
+    if isinstance(content, list):
+        texts = [item["text"] for item in content if item.get("type") == "text"]
+        return texts[0] if texts else None
+    return content
+
+
 def _get_default_inference_config() -> InferenceConfig:
     return InferenceConfig(
         generation=GenerationParams(max_new_tokens=5),
@@ -849,14 +870,13 @@ def test_infer_online_multiple_requests():
 
     def response_callback(url: str, **kwargs: Any) -> CallbackResult:
         """Callback for mocked API responses."""
-        request = kwargs.get("json", {})
+        request = json.loads(kwargs["data"])
         messages = request.get("messages", [])
         if not messages:
             raise ValueError("No messages in request")
-        content = messages[0].get("content", [])
-        if not content:
+        conversation_id = _get_first_message_text(messages[0])
+        if not conversation_id:
             raise ValueError("No content in message")
-        conversation_id = content[0].get("text")
 
         if response := response_by_conversation_id.get(conversation_id):
             # Extract status and payload from the response dict
@@ -935,6 +955,140 @@ def test_infer_online_multiple_requests():
         assert expected_result == result
 
 
+def test_infer_online_bounds_in_flight_requests():
+    """Test that at most `num_workers` requests are in flight, in input order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_query_api(conversation, semaphore, session, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return conversation
+
+    engine = RemoteInferenceEngine(
+        _get_default_model_params(),
+        remote_params=RemoteParams(
+            api_url=_TARGET_SERVER,
+            num_workers=3,
+            use_adaptive_concurrency=False,
+        ),
+    )
+    conversations = [
+        Conversation(
+            messages=[Message(content=f"Hello {i}", role=Role.USER)],
+            conversation_id=str(i),
+        )
+        for i in range(20)
+    ]
+
+    with patch.object(engine, "_query_api", side_effect=mock_query_api):
+        result = engine.infer(conversations, _get_default_inference_config())
+
+    assert max_in_flight == 3
+    assert [c.conversation_id for c in result] == [str(i) for i in range(20)]
+
+
+def test_infer_online_builds_request_headers_once():
+    """Test that the request headers are built once and sent with every request."""
+    authorization_headers = []
+
+    def callback(url, **kwargs):
+        authorization_headers.append(kwargs["headers"]["Authorization"])
+
+    with aioresponses() as m:
+        m.post(
+            _TARGET_SERVER,
+            status=200,
+            payload={"choices": [{"message": {"role": "assistant", "content": "Hi"}}]},
+            callback=callback,
+            repeat=True,
+        )
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(
+                api_url=_TARGET_SERVER, api_key="test-key", num_workers=2
+            ),
+        )
+        conversations = [
+            Conversation(messages=[Message(content=f"Hello {i}", role=Role.USER)])
+            for i in range(5)
+        ]
+
+        with patch.object(
+            engine, "_get_request_headers", wraps=engine._get_request_headers
+        ) as mock_get_request_headers:
+            result = engine.infer(conversations, _get_default_inference_config())
+
+        assert len(result) == 5
+        mock_get_request_headers.assert_called_once()
+        assert authorization_headers == ["Bearer test-key"] * 5
+
+
+def test_infer_online_builds_request_headers_per_request_if_not_cached():
+    """Test that uncached headers (e.g., short-lived tokens) are built per request."""
+    with aioresponses() as m:
+        m.post(
+            _TARGET_SERVER,
+            status=200,
+            payload={"choices": [{"message": {"role": "assistant", "content": "Hi"}}]},
+            repeat=True,
+        )
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(
+                api_url=_TARGET_SERVER, api_key="test-key", num_workers=2
+            ),
+        )
+        engine._cache_request_headers = False
+        conversations = [
+            Conversation(messages=[Message(content=f"Hello {i}", role=Role.USER)])
+            for i in range(3)
+        ]
+
+        with patch.object(
+            engine, "_get_request_headers", wraps=engine._get_request_headers
+        ) as mock_get_request_headers:
+            result = engine.infer(conversations, _get_default_inference_config())
+
+        assert len(result) == 3
+        assert mock_get_request_headers.call_count == 3
+
+
+def test_infer_online_converts_images_in_thread():
+    """Test that conversations with images are converted off the event loop."""
+    with aioresponses() as m:
+        m.post(
+            _TARGET_SERVER,
+            status=200,
+            payload={
+                "choices": [{"message": {"role": "assistant", "content": "A wave."}}]
+            },
+            repeat=True,
+        )
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(api_url=_TARGET_SERVER),
+        )
+
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            engine.infer(
+                [create_test_text_only_conversation()],
+                _get_default_inference_config(),
+            )
+            assert mock_to_thread.call_count == 0
+
+            result = engine.infer(
+                [create_test_multimodal_text_image_conversation()],
+                _get_default_inference_config(),
+            )
+            assert mock_to_thread.call_count == 1
+
+        assert result[0].messages[-1].content == "A wave."
+
+
 def test_infer_online_multiple_requests_politeness():
     # Note: We use the first message's content as the key to avoid
     # stringifying the message object.
@@ -969,14 +1123,13 @@ def test_infer_online_multiple_requests_politeness():
 
     def response_callback(url: str, **kwargs: Any) -> CallbackResult:
         """Callback for mocked API responses."""
-        request = kwargs.get("json", {})
+        request = json.loads(kwargs["data"])
         messages = request.get("messages", [])
         if not messages:
             raise ValueError("No messages in request")
-        content = messages[0].get("content", [])
-        if not content:
+        conversation_id = _get_first_message_text(messages[0])
+        if not conversation_id:
             raise ValueError("No content in message")
-        conversation_id = content[0].get("text")
 
         if response := response_by_conversation_id.get(conversation_id):
             # Extract status and payload from the response dict
@@ -1112,14 +1265,13 @@ def test_infer_online_multiple_requests_politeness_multiple_workers():
 
     def response_callback(url: str, **kwargs: Any) -> CallbackResult:
         """Callback for mocked API responses."""
-        request = kwargs.get("json", {})
+        request = json.loads(kwargs["data"])
         messages = request.get("messages", [])
         if not messages:
             raise ValueError("No messages in request")
-        content = messages[0].get("content", [])
-        if not content:
+        conversation_id = _get_first_message_text(messages[0])
+        if not conversation_id:
             raise ValueError("No content in message")
-        conversation_id = content[0].get("text")
 
         if response := response_by_conversation_id.get(conversation_id):
             # Extract status and payload from the response dict
@@ -1296,14 +1448,13 @@ def test_infer_from_file_to_file():
 
         def response_callback(url: str, **kwargs: Any) -> CallbackResult:
             """Callback for mocked API responses."""
-            request = kwargs.get("json", {})
+            request = json.loads(kwargs["data"])
             messages = request.get("messages", [])
             if not messages:
                 raise ValueError("No messages in request")
-            content = messages[0].get("content", [])
-            if not content:
+            conversation_id = _get_first_message_text(messages[0])
+            if not conversation_id:
                 raise ValueError("No content in message")
-            conversation_id = content[0].get("text")
 
             if response := response_by_conversation_id.get(conversation_id):
                 # Extract status and payload from the response dict
@@ -1427,14 +1578,13 @@ def test_infer_from_file_to_file_failure_midway():
 
         def response_callback(url: str, **kwargs: Any) -> CallbackResult:
             """Callback for mocked API responses."""
-            request = kwargs.get("json", {})
+            request = json.loads(kwargs["data"])
             messages = request.get("messages", [])
             if not messages:
                 raise ValueError("No messages in request")
-            content = messages[0].get("content", [])
-            if not content:
+            conversation_id = _get_first_message_text(messages[0])
+            if not conversation_id:
                 raise ValueError("No content in message")
-            conversation_id = content[0].get("text")
 
             if response := response_by_conversation_id.get(conversation_id):
                 # Extract status and payload from the response dict
@@ -1695,6 +1845,40 @@ def test_convert_conversation_to_api_input_with_json_schema():
     }
 
 
+def test_convert_conversation_to_api_input_resolves_json_schema_once():
+    """Test that the guided decoding schema is resolved once for many requests."""
+
+    class CachedResponseSchema(BaseModel):
+        answer: str
+
+    engine = RemoteInferenceEngine(
+        _get_default_model_params(), remote_params=RemoteParams(api_url=_TARGET_SERVER)
+    )
+    generation_params = GenerationParams(
+        max_new_tokens=5,
+        guided_decoding=GuidedDecodingParams(json=CachedResponseSchema),
+    )
+    expected_schema = CachedResponseSchema.model_json_schema()
+
+    with patch.object(
+        CachedResponseSchema,
+        "model_json_schema",
+        wraps=CachedResponseSchema.model_json_schema,
+    ) as mock_model_json_schema:
+        results = [
+            engine._convert_conversation_to_api_input(
+                create_test_text_only_conversation(),
+                generation_params,
+                _get_default_model_params(),
+            )
+            for _ in range(3)
+        ]
+
+    assert mock_model_json_schema.call_count == 1
+    for result in results:
+        assert result["response_format"]["json_schema"]["schema"] == expected_schema
+
+
 def test_convert_conversation_to_api_input_without_guided_decoding():
     """Test conversion without guided decoding."""
     engine = RemoteInferenceEngine(
@@ -1719,6 +1903,75 @@ def test_convert_conversation_to_api_input_without_guided_decoding():
     assert "response_format" not in result
 
 
+def test_convert_conversation_to_api_input_messages():
+    """Test that text-only turns are sent as strings and same-role turns grouped."""
+    engine = RemoteInferenceEngine(
+        _get_default_model_params(), remote_params=RemoteParams(api_url=_TARGET_SERVER)
+    )
+    conversation = create_test_text_only_conversation()
+    conversation.messages.append(Message(content="Describe this", role=Role.USER))
+
+    result = engine._convert_conversation_to_api_input(
+        conversation, GenerationParams(max_new_tokens=5), _get_default_model_params()
+    )
+
+    assert result["messages"] == [
+        {"role": "system", "content": "You are an assistant!"},
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi there!"},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "How are you?"},
+                {"type": "text", "text": "Describe this"},
+            ],
+        },
+    ]
+
+
+def test_convert_conversation_to_api_input_caches_shared_images():
+    """Test that images shared across conversations are only loaded once."""
+    engine = RemoteInferenceEngine(
+        _get_default_model_params(), remote_params=RemoteParams(api_url=_TARGET_SERVER)
+    )
+    image_path = str(_TEST_IMAGE_DIR / "the_great_wave_off_kanagawa.jpg")
+    conversations = [
+        Conversation(
+            messages=[
+                Message(
+                    role=Role.USER,
+                    content=[
+                        ContentItem(content=image_path, type=Type.IMAGE_PATH),
+                        ContentItem(content=question, type=Type.TEXT),
+                    ],
+                ),
+            ],
+        )
+        for question in ("Describe this image", "What colors are used?")
+    ]
+
+    with patch(
+        "oumi.utils.conversation_utils.load_image_png_bytes_from_path",
+        wraps=load_image_png_bytes_from_path,
+    ) as mock_load:
+        results = [
+            engine._convert_conversation_to_api_input(
+                conversation,
+                GenerationParams(max_new_tokens=5),
+                _get_default_model_params(),
+            )
+            for conversation in conversations
+        ]
+
+    assert mock_load.call_count == 1
+    first_content = results[0]["messages"][0]["content"]
+    second_content = results[1]["messages"][0]["content"]
+    assert first_content[0] == second_content[0]
+    assert first_content[0]["image_url"]["url"].startswith("data:image/png;base64,")
+    assert first_content[1] == {"type": "text", "text": "Describe this image"}
+    assert second_content[1] == {"type": "text", "text": "What colors are used?"}
+
+
 def test_convert_conversation_to_api_input_with_invalid_guided_decoding():
     """Test conversion with invalid guided decoding raises error."""
     engine = RemoteInferenceEngine(
@@ -1955,6 +2208,31 @@ def test_get_request_headers_missing_env_var():
         assert headers == {}
 
 
+def test_get_shared_request_headers(monkeypatch):
+    """Test that batch and file request headers are reused until the key changes."""
+    monkeypatch.setenv("TEST_API_KEY", "key-1")
+    engine = RemoteInferenceEngine(
+        _get_default_model_params(),
+        remote_params=RemoteParams(
+            api_url=_TARGET_SERVER, api_key_env_varname="TEST_API_KEY"
+        ),
+    )
+
+    with patch.object(
+        engine, "_get_request_headers", wraps=engine._get_request_headers
+    ) as mock_get_request_headers:
+        headers = engine._get_shared_request_headers()
+        assert headers == {"Authorization": "Bearer key-1"}
+        assert engine._get_shared_request_headers() is headers
+        assert mock_get_request_headers.call_count == 1
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "Bearer other-key"  # type: ignore
+
+        monkeypatch.setenv("TEST_API_KEY", "key-2")
+        assert engine._get_shared_request_headers() == {"Authorization": "Bearer key-2"}
+        assert mock_get_request_headers.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_upload_batch_file():
     """Test uploading a batch file."""
@@ -1979,10 +2257,95 @@ async def test_upload_batch_file():
             }
         ]
 
-        # Patch aiofiles.open to return our async context manager
-        with patch("aiofiles.open", return_value=AsyncContextManagerMock()):
-            file_id = await engine._upload_batch_file(batch_requests)
-            assert file_id == "file-123"
+        file_id = await engine._upload_batch_file(batch_requests)
+        assert file_id == "file-123"
+
+
+@pytest.mark.asyncio
+async def test_upload_batch_file_streams_requests():
+    """Test that the uploaded multipart body holds the batch requests as JSONL."""
+    uploaded_fields = {}
+
+    async def handle_upload(request: web.Request) -> web.Response:
+        form = await request.post()
+        uploaded_fields["purpose"] = form["purpose"]
+        uploaded_fields["filename"] = form["file"].filename  # type: ignore
+        uploaded_fields["content"] = form["file"].file.read()  # type: ignore
+        return web.json_response({"id": "file-123"})
+
+    app = web.Application()
+    app.router.add_post("/v1/files", handle_upload)
+    async with TestServer(app) as server:
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(
+                api_url=str(server.make_url("/v1/chat/completions"))
+            ),
+        )
+        batch_requests = [
+            {
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"messages": [{"role": "user", "content": f"Hello {i}"}]},
+            }
+            for i in range(3)
+        ]
+
+        try:
+            file_id = await engine._upload_batch_file(iter(batch_requests))
+        finally:
+            await engine.aclose()
+
+    assert file_id == "file-123"
+    assert uploaded_fields["purpose"] == "batch"
+    assert uploaded_fields["filename"] == "batch_requests.jsonl"
+    lines = uploaded_fields["content"].decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == batch_requests
+
+
+@pytest.mark.asyncio
+async def test_upload_batch_file_reraises_request_errors():
+    """Test that errors building requests mid-upload aren't reported as I/O errors."""
+
+    async def handle_upload(request: web.Request) -> web.Response:
+        await request.read()
+        return web.json_response({"id": "file-123"})
+
+    def batch_requests():
+        yield {"custom_id": "request-0", "body": {}}
+        raise ValueError("Invalid request")
+
+    app = web.Application()
+    app.router.add_post("/v1/files", handle_upload)
+    async with TestServer(app) as server:
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(
+                api_url=str(server.make_url("/v1/chat/completions"))
+            ),
+        )
+        try:
+            with pytest.raises(ValueError, match="Invalid request"):
+                await engine._upload_batch_file(batch_requests())
+        finally:
+            await engine.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_jsonl_chunks():
+    """Test that batch requests are streamed as JSON lines."""
+    records = [{"custom_id": f"request-{i}", "body": {"n": i}} for i in range(1000)]
+
+    with patch(
+        "oumi.inference.remote_inference_engine._BATCH_FILE_UPLOAD_CHUNK_SIZE", 1024
+    ):
+        chunks = [chunk async for chunk in _iter_jsonl_chunks(records)]
+
+    assert len(chunks) > 1
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == records
 
 
 @pytest.mark.asyncio
@@ -2013,13 +2376,40 @@ async def test_create_batch():
             ]
         )
 
-        with patch("aiofiles.open", return_value=AsyncContextManagerMock()):
-            batch_id = await engine._create_batch(
-                [conversation],
-                _get_default_inference_config().generation,
-                _get_default_model_params(),
-            )
-            assert batch_id == "batch-456"
+        batch_id = await engine._create_batch(
+            [conversation],
+            _get_default_inference_config().generation,
+            _get_default_model_params(),
+        )
+        assert batch_id == "batch-456"
+
+
+@pytest.mark.asyncio
+async def test_create_batch_invalid_params():
+    """Test that invalid parameters are reported before the batch file is uploaded."""
+    with aioresponses() as m:
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(api_url=_TARGET_SERVER),
+        )
+        conversation = Conversation(
+            messages=[
+                Message(content="Hello", role=Role.USER),
+            ]
+        )
+
+        with patch.object(
+            engine,
+            "_convert_conversation_to_api_input",
+            side_effect=ValueError("Invalid generation params"),
+        ):
+            with pytest.raises(ValueError, match="Invalid generation params"):
+                await engine._create_batch(
+                    [conversation],
+                    _get_default_inference_config().generation,
+                    _get_default_model_params(),
+                )
+        assert not m.requests
 
 
 @pytest.mark.asyncio
@@ -2053,6 +2443,35 @@ async def test_get_batch_status():
         assert status.failed_requests == 1
 
 
+@pytest.mark.asyncio
+async def test_get_batch_status_caches_terminal_status():
+    """Test that only terminal batch statuses are cached."""
+    with aioresponses() as m:
+        m.get(
+            f"{_TARGET_SERVER_BASE}/v1/batches/batch-123",
+            status=200,
+            payload={"id": "batch-123", "status": "in_progress"},
+        )
+        m.get(
+            f"{_TARGET_SERVER_BASE}/v1/batches/batch-123",
+            status=200,
+            payload={"id": "batch-123", "status": "completed"},
+        )
+
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(api_url=_TARGET_SERVER),
+        )
+
+        status = await engine._get_batch_status("batch-123")
+        assert status.status == BatchStatus.IN_PROGRESS
+        status = await engine._get_batch_status("batch-123")
+        assert status.status == BatchStatus.COMPLETED
+        # No more responses are mocked, so this must not query the API.
+        status = await engine._get_batch_status("batch-123")
+        assert status.status == BatchStatus.COMPLETED
+
+
 @pytest.mark.asyncio
 async def test_get_batch_results():
     """Test getting batch results."""
@@ -2117,6 +2536,28 @@ async def test_get_batch_results():
         assert results[0].messages[-1].role == Role.ASSISTANT
 
 
+@pytest.mark.asyncio
+async def test_iter_file_records():
+    """Test streaming a JSONL file record by record."""
+    records = [{"custom_id": f"request-{i}", "text": "x" * 1000} for i in range(50)]
+    with aioresponses() as m:
+        m.get(
+            f"{_TARGET_SERVER_BASE}/v1/files/file-123/content",
+            status=200,
+            body="\n".join(json.dumps(r) for r in records) + "\n\n",
+        )
+
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(api_url=_TARGET_SERVER),
+        )
+
+        result = [record async for record in engine._iter_file_records("file-123")]
+        await engine.aclose()
+
+    assert result == records
+
+
 def test_infer_batch():
     """Test the public infer_batch method."""
     with aioresponses() as m:
@@ -2144,12 +2585,8 @@ def test_infer_batch():
             ]
         )
 
-        # Use AsyncContextManagerMock instead of AsyncMock
-        with patch("aiofiles.open", return_value=AsyncContextManagerMock()):
-            batch_id = engine.infer_batch(
-                [conversation], _get_default_inference_config()
-            )
-            assert batch_id == "batch-456"
+        batch_id = engine.infer_batch([conversation], _get_default_inference_config())
+        assert batch_id == "batch-456"
 
 
 def test_get_batch_status_public():
@@ -2399,6 +2836,19 @@ async def test_list_batches():
         assert not response.has_more
 
 
+def test_batch_info_from_api_response_without_request_counts():
+    """Test parsing a batch whose request counts are not reported yet."""
+    batch = BatchInfo.from_api_response(
+        {"id": "batch-123", "status": "validating", "request_counts": None}
+    )
+
+    assert batch.status == BatchStatus.VALIDATING
+    assert batch.total_requests == 0
+    assert batch.completed_requests == 0
+    assert batch.failed_requests == 0
+    assert not hasattr(batch, "__dict__")
+
+
 def test_list_batches_public():
     """Test the public list_batches method."""
     with aioresponses() as m:
@@ -2442,6 +2892,221 @@ def test_list_batches_public():
         assert response.has_more
 
 
+def test_wait_for_batch(mock_asyncio_sleep):
+    """Test polling a batch until it reaches a terminal state."""
+    with aioresponses() as m:
+        batch_url = f"{_TARGET_SERVER_BASE}/v1/batches/batch-123"
+        m.get(
+            batch_url, status=200, payload={"id": "batch-123", "status": "validating"}
+        )
+        m.get(
+            batch_url, status=200, payload={"id": "batch-123", "status": "in_progress"}
+        )
+        m.get(batch_url, status=200, payload={"id": "batch-123", "status": "completed"})
+
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(api_url=_TARGET_SERVER),
+        )
+
+        status = engine.wait_for_batch("batch-123", poll_interval=10)
+
+        assert status.status == BatchStatus.COMPLETED
+        poll_sleeps = [
+            call.args[0] for call in mock_asyncio_sleep.call_args_list if call.args[0]
+        ]
+        assert poll_sleeps == [10, 10]
+
+
+@pytest.mark.parametrize(
+    "timeout,expected_poll_sleeps",
+    [
+        (5, [5]),
+        (25, [10, 10, 5]),
+    ],
+)
+def test_wait_for_batch_timeout(timeout, expected_poll_sleeps):
+    """Test that waiting for a batch polls until the timeout, then fails."""
+    now = 0.0
+
+    async def mock_sleep(delay):
+        nonlocal now
+        now += delay
+
+    with (
+        aioresponses() as m,
+        patch("asyncio.sleep", side_effect=mock_sleep) as mock_asyncio_sleep,
+        patch("oumi.inference.remote_inference_engine.time") as mock_time,
+    ):
+        mock_time.monotonic.side_effect = lambda: now
+        m.get(
+            f"{_TARGET_SERVER_BASE}/v1/batches/batch-123",
+            status=200,
+            payload={"id": "batch-123", "status": "in_progress"},
+            repeat=True,
+        )
+
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(api_url=_TARGET_SERVER),
+        )
+
+        with pytest.raises(
+            TimeoutError, match=f"did not finish within {timeout} seconds"
+        ):
+            engine.wait_for_batch("batch-123", poll_interval=10, timeout=timeout)
+
+        poll_sleeps = [
+            call.args[0] for call in mock_asyncio_sleep.call_args_list if call.args[0]
+        ]
+        assert poll_sleeps == expected_poll_sleeps
+        # The batch is polled once more at the deadline.
+        assert (
+            sum(len(calls) for calls in m.requests.values())
+            == len(expected_poll_sleeps) + 1
+        )
+        assert now == timeout
+
+
+@pytest.mark.asyncio
+async def test_batch_operations_reuse_session():
+    """Test that batch operations share one session per event loop."""
+    with aioresponses() as m:
+        m.get(
+            f"{_TARGET_SERVER_BASE}/v1/batches/batch-123",
+            status=200,
+            payload={"id": "batch-123", "status": "in_progress"},
+            repeat=True,
+        )
+
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(api_url=_TARGET_SERVER),
+        )
+
+        with patch("aiohttp.ClientSession", wraps=aiohttp.ClientSession) as mock_cls:
+            await engine._get_batch_status("batch-123")
+            await engine._get_batch_status("batch-123")
+            assert mock_cls.call_count == 1
+
+            session = await engine._get_session()
+            await engine.aclose()
+            assert session.closed
+
+            new_session = await engine._get_session()
+            assert new_session is not session
+            await engine.aclose()
+
+
+@pytest.mark.asyncio
+async def test_list_files():
+    """Test listing files."""
+    with aioresponses() as m:
+        m.get(
+            f"{_TARGET_SERVER_BASE}/v1/files?limit=10&order=desc&purpose=batch",
+            status=200,
+            payload={
+                "data": [
+                    {
+                        "id": f"file-{i}",
+                        "object": "file",
+                        "filename": f"batch_{i}.jsonl",
+                        "bytes": 100 * i,
+                        "created_at": 1234567890 + i,
+                        "purpose": "batch",
+                    }
+                    for i in range(2)
+                ],
+                "has_more": True,
+            },
+        )
+
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(api_url=_TARGET_SERVER),
+        )
+
+        response = await engine._list_files(purpose="batch", limit=10)
+        assert response.files == [
+            FileInfo(
+                id="file-0",
+                filename="batch_0.jsonl",
+                bytes=0,
+                created_at=1234567890,
+                purpose="batch",
+            ),
+            FileInfo(
+                id="file-1",
+                filename="batch_1.jsonl",
+                bytes=100,
+                created_at=1234567891,
+                purpose="batch",
+            ),
+        ]
+        assert response.has_more
+
+
+@pytest.mark.asyncio
+async def test_create_connector():
+    """Test the connection pool settings of the HTTP sessions."""
+    engine = RemoteInferenceEngine(
+        _get_default_model_params(),
+        remote_params=RemoteParams(api_url=_TARGET_SERVER),
+    )
+
+    connector = engine._create_connector()
+    try:
+        assert connector.limit == engine._get_connection_limit()
+        assert connector._keepalive_timeout == 30.0
+        assert connector.use_dns_cache
+        assert connector._cached_hosts._ttl == 300
+    finally:
+        await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_file_operations_reuse_session():
+    """Test that file operations share the session of batch operations."""
+    with aioresponses() as m:
+        m.get(
+            f"{_TARGET_SERVER_BASE}/v1/files/file-123",
+            status=200,
+            payload={
+                "id": "file-123",
+                "filename": "batch_requests.jsonl",
+                "bytes": 100,
+                "created_at": 1234567890,
+                "purpose": "batch",
+            },
+        )
+        m.get(
+            f"{_TARGET_SERVER_BASE}/v1/files/file-123/content",
+            status=200,
+            body="file content",
+        )
+        m.delete(
+            f"{_TARGET_SERVER_BASE}/v1/files/file-123",
+            status=200,
+            payload={"id": "file-123", "deleted": True},
+        )
+
+        engine = RemoteInferenceEngine(
+            _get_default_model_params(),
+            remote_params=RemoteParams(api_url=_TARGET_SERVER),
+        )
+
+        with patch("aiohttp.ClientSession", wraps=aiohttp.ClientSession) as mock_cls:
+            file_info = await engine._get_file("file-123")
+            content = await engine._download_file("file-123")
+            deleted = await engine._delete_file("file-123")
+            await engine.aclose()
+
+        assert file_info.id == "file-123"
+        assert content == "file content"
+        assert deleted
+        assert mock_cls.call_count == 1
+
+
 def test_infer_online_handles_content_type_text_plain():
     """Test that the engine can handle text/plain responses and parse them as JSON."""
     with aioresponses() as m:
@@ -2621,6 +3286,56 @@ async def test_infer_online_exponential_backoff(mock_polite_adaptive_semaphore):
             )  # Second retry: base delay * 2
 
 
+@pytest.mark.asyncio
+async def test_infer_online_honors_retry_after(mock_polite_adaptive_semaphore):
+    """Test that the engine waits as long as the server asks on rate limits."""
+    sleep_calls = []
+
+    async def mock_sleep(delay):
+        sleep_calls.append(delay)
+
+    def callback(url, **kwargs):
+        if not sleep_calls:
+            return CallbackResult(
+                status=429,
+                body=json.dumps({"error": {"message": "Rate limited"}}),
+                content_type="application/json",
+                headers={"Retry-After": "0.7"},
+            )
+        return CallbackResult(
+            status=200,
+            payload={
+                "choices": [{"message": {"role": "assistant", "content": "Success"}}]
+            },
+        )
+
+    with aioresponses() as m:
+        m.post(_TARGET_SERVER, callback=callback, repeat=True)
+
+        with patch("asyncio.sleep", side_effect=mock_sleep):
+            remote_params = RemoteParams(
+                api_url=_TARGET_SERVER,
+                max_retries=3,
+                retry_backoff_base=0.2,
+                retry_backoff_max=1.0,
+            )
+            engine = RemoteInferenceEngine(
+                model_params=_get_default_model_params(),
+                remote_params=remote_params,
+            )
+            inference_config = _get_default_inference_config()
+            inference_config.remote_params = remote_params
+
+            result = engine.infer(
+                [Conversation(messages=[Message(role=Role.USER, content="Hello")])],
+                inference_config,
+            )
+
+            assert result[0].messages[-1].content == "Success"
+            backoff_sleeps = [s for s in sleep_calls if s > 0]
+            assert backoff_sleeps == [pytest.approx(0.7)]
+
+
 def test_non_retriable_errors(mock_asyncio_sleep):
     """Test that certain HTTP status codes are not retried."""
     non_retriable_codes = [400, 401, 403, 404, 422]
@@ -2853,6 +3568,25 @@ def test_retry_with_different_errors():
         assert attempt == 4  # Verify all attempts were made
 
 
+def test_init_does_not_mutate_remote_params():
+    """Test that engine defaults are not written into the caller's params."""
+
+    class _EngineWithDefaults(RemoteInferenceEngine):
+        base_url = _TARGET_SERVER
+        api_key_env_varname = "TEST_API_KEY"
+
+    remote_params = RemoteParams(num_workers=4)
+    engine = _EngineWithDefaults(
+        _get_default_model_params(), remote_params=remote_params
+    )
+
+    assert engine._remote_params.api_url == _TARGET_SERVER
+    assert engine._remote_params.api_key_env_varname == "TEST_API_KEY"
+    assert engine._remote_params.num_workers == 4
+    assert remote_params.api_url is None
+    assert remote_params.api_key_env_varname is None
+
+
 def test_adaptive_concurrency_initialization_enabled():
     """Test that adaptive concurrency controller is initialized when enabled."""
     remote_params = RemoteParams(
@@ -12,13 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import email.utils
+import time
 from unittest.mock import AsyncMock
 
 import aiohttp
 import pytest
 
 from oumi.utils.http import (
+    get_error_text_from_response,
     get_failure_reason_from_response,
+    get_retry_after_seconds,
     is_non_retriable_status_code,
 )
 
@@ -84,3 +88,62 @@ async def test_get_failure_reason_from_response_with_json_error():
 
     result = await get_failure_reason_from_response(mock_response)
     assert result == "HTTP 400"
+
+
+@pytest.mark.parametrize(
+    "status_code,headers,expected",
+    [
+        (429, {"Retry-After": "5"}, 5.0),
+        (503, {"Retry-After": "1.5"}, 1.5),
+        (429, {"retry-after-ms": "250", "Retry-After": "5"}, 0.25),
+        (429, {"Retry-After": "-3"}, 0.0),
+        (429, {"Retry-After": "not-a-date"}, None),
+        (429, {}, None),
+        (500, {"Retry-After": "5"}, None),
+    ],
+)
+def test_get_retry_after_seconds(status_code: int, headers: dict, expected):
+    """Test parsing of the server-requested retry delay."""
+    mock_response = AsyncMock(spec=aiohttp.ClientResponse)
+    mock_response.status = status_code
+    mock_response.headers = headers
+
+    assert get_retry_after_seconds(mock_response) == expected
+
+
+def test_get_retry_after_seconds_http_date():
+    """Test parsing of `Retry-After` given as an HTTP date."""
+    mock_response = AsyncMock(spec=aiohttp.ClientResponse)
+    mock_response.status = 429
+    mock_response.headers = {
+        "Retry-After": email.utils.formatdate(time.time() + 60, usegmt=True)
+    }
+
+    result = get_retry_after_seconds(mock_response)
+    assert result is not None
+    assert 55 < result <= 60
+
+
+@pytest.mark.asyncio
+async def test_get_error_text_from_response():
+    """Test reading the body of an error response."""
+    mock_response = AsyncMock(spec=aiohttp.ClientResponse)
+    mock_response.content = AsyncMock()
+    mock_response.content.read.side_effect = [b"Bad ", b"request", b""]
+    mock_response.content.at_eof = lambda: True
+
+    assert await get_error_text_from_response(mock_response) == "Bad request"
+
+
+@pytest.mark.asyncio
+async def test_get_error_text_from_response_truncates_large_body():
+    """Test that only the beginning of a large error response is read."""
+    mock_response = AsyncMock(spec=aiohttp.ClientResponse)
+    mock_response.content = AsyncMock()
+    mock_response.content.read.side_effect = [b"x" * 6, b"y" * 4]
+    mock_response.content.at_eof = lambda: False
+
+    result = await get_error_text_from_response(mock_response, max_bytes=10)
+    assert result == "xxxxxxyyyy..."
+    assert mock_response.content.read.call_count == 2
+    mock_response.content.read.assert_called_with(4)
@@ -0,0 +1,137 @@
+import logging
+import logging.handlers
+import os
+import sys
+
+import pytest
+
+from oumi.utils.logging import (
+    _queue_listeners,
+    _stop_queue_listener,
+    _use_direct_handlers_after_fork,
+    configure_logger,
+    update_logger_level,
+)
+
+
+@pytest.fixture
+def logger_name():
+    name = "oumi.test_logging"
+    yield name
+    _stop_queue_listener(name)
+    logger = logging.getLogger(name)
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers = []
+
+
+@pytest.fixture
+def queue_logging(monkeypatch):
+    monkeypatch.setenv("OUMI_ENABLE_QUEUE_LOGGING", "1")
+    monkeypatch.setenv("OUMI_DISABLE_RICH_LOGGING", "1")
+
+
+def _read_log_messages(log_dir) -> list[str]:
+    log_file = next(log_dir.glob("rank_*.log"))
+    return [line.rsplit("] ", 1)[-1] for line in log_file.read_text().splitlines()]
+
+
+def test_configure_logger_level(logger_name):
+    configure_logger(logger_name, level="warning")
+
+    logger = logging.getLogger(logger_name)
+    assert logger.level == logging.WARNING
+    assert all(handler.level == logging.WARNING for handler in logger.handlers)
+
+
+def test_configure_logger_unknown_level(logger_name):
+    with pytest.raises(ValueError, match="Unknown level: 'verbose'"):
+        configure_logger(logger_name, level="verbose")
+
+
+def test_update_logger_level(logger_name):
+    configure_logger(logger_name, level="info")
+    update_logger_level(logger_name, level="debug")
+
+    logger = logging.getLogger(logger_name)
+    assert logger.level == logging.DEBUG
+    assert all(handler.level == logging.DEBUG for handler in logger.handlers)
+
+
+def test_queue_logging(logger_name, queue_logging, tmp_path):
+    configure_logger(logger_name, level="info", log_dir=tmp_path)
+    logger = logging.getLogger(logger_name)
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+
+    logger.debug("skipped")
+    logger.info("first")
+    logger.warning("second")
+    _stop_queue_listener(logger_name)
+
+    assert _read_log_messages(tmp_path) == ["first", "second"]
+
+
+def test_queue_logging_keeps_queued_records_after_level_change(
+    logger_name, queue_logging, tmp_path
+):
+    configure_logger(logger_name, level="debug", log_dir=tmp_path)
+    logger = logging.getLogger(logger_name)
+    file_handler = next(
+        handler
+        for handler in _queue_listeners[logger_name].handlers
+        if isinstance(handler, logging.FileHandler)
+    )
+
+    # Block the listener thread while the records are enqueued and the level
+    # is raised, so that the records are still queued when it changes.
+    file_handler.acquire()
+    try:
+        for i in range(3):
+            logger.debug(f"debug-{i}")
+        update_logger_level(logger_name, level="info")
+        logger.debug("skipped")
+    finally:
+        file_handler.release()
+    _stop_queue_listener(logger_name)
+
+    assert logger.handlers[0].level == logging.INFO
+    assert _read_log_messages(tmp_path) == ["debug-0", "debug-1", "debug-2"]
+
+
+def test_queue_logging_uses_direct_handlers_after_fork(
+    logger_name, queue_logging, tmp_path
+):
+    configure_logger(logger_name, level="info", log_dir=tmp_path)
+    logger = logging.getLogger(logger_name)
+    listener = _queue_listeners[logger_name]
+
+    _use_direct_handlers_after_fork()
+    listener.stop()
+
+    assert logger_name not in _queue_listeners
+    assert logger.handlers == list(listener.handlers)
+    logger.info("after fork")
+    assert _read_log_messages(tmp_path) == ["after fork"]
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "fork") or sys.platform == "darwin",
+    reason="Requires fork start method.",
+)
+def test_queue_logging_in_forked_child(logger_name, queue_logging, tmp_path):
+    configure_logger(logger_name, level="info", log_dir=tmp_path)
+    logger = logging.getLogger(logger_name)
+    logger.info("parent")
+    _queue_listeners[logger_name].queue.join()  # type: ignore
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            logger.info("child")
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    _stop_queue_listener(logger_name)
+
+    assert _read_log_messages(tmp_path) == ["parent", "child"]